@@ -2,11 +2,14 @@ export class FlightPulseConstants {
     static readonly PROJECT_NAME = 'FlightPulse';
     static readonly TABLE_NAME = 'FlightPulseTable';
     static readonly EVENT_BUS_NAME = 'flightpulse-bus';
+    static readonly KAFKA_TOPIC = 'flight-operations';
     static readonly WORKFLOW_DLQ_NAME = 'WorkflowDLQ';
     static readonly WORKFLOW_ERROR_TOPIC_NAME = 'flightpulse-workflow-errors';
     static readonly ALARM_TOPIC_NAME = 'flightpulse-alarms';
     static readonly BEDROCK_MODEL_PARAM_NAME = '/flightpulse/bedrock/model-id';
     static readonly BEDROCK_MODEL_ID = 'anthropic.claude-3-haiku-20240307-v1:0';
+    static readonly LLM_MESSENGER_ALIAS = 'live';
+    static readonly LLM_MESSENGER_PROVISIONED_CONCURRENCY = 1;
 
     static readonly SERVICE_NAME = {
         KAFKA_CONSUMER: 'KafkaConsumer',
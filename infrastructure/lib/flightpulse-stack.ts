@@ -3,6 +3,7 @@ import * as dynamodb from 'aws-cdk-lib/aws-dynamodb';
 import * as events from 'aws-cdk-lib/aws-events';
 import * as targets from 'aws-cdk-lib/aws-events-targets';
 import * as lambda from 'aws-cdk-lib/aws-lambda';
+import * as lambdaEventSources from 'aws-cdk-lib/aws-lambda-event-sources';
 import * as sfn from 'aws-cdk-lib/aws-stepfunctions';
 import * as sfnTasks from 'aws-cdk-lib/aws-stepfunctions-tasks';
 import * as apigateway from 'aws-cdk-lib/aws-apigateway';
@@ -105,6 +106,43 @@ export class FlightPulseStack extends cdk.Stack {
     table.grantReadWriteData(kafkaConsumer);
     eventBus.grantPutEventsTo(kafkaConsumer);
 
+    // Kafka → Kafka Consumer (only when a cluster reachable from the VPC is configured)
+    const kafkaBootstrapServers: string | undefined = this.node.tryGetContext('kafkaBootstrapServers');
+    if (kafkaBootstrapServers) {
+      // The mapping's pollers run in the isolated subnets and call STS to assume
+      // the consumer's role; the Lambda endpoint is already created by NetworkConstruct
+      network.vpc.addInterfaceEndpoint('StsEndpoint', {
+        service: cdk.aws_ec2.InterfaceVpcEndpointAwsService.STS,
+        securityGroups: [network.lambdaSecurityGroup],
+      });
+
+      // Batches the mapping gives up on are recorded here instead of being lost
+      const kafkaFailureQueue = new sqs.Queue(this, 'KafkaFailureQueue', {
+        retentionPeriod: cdk.Duration.days(14),
+      });
+
+      kafkaConsumer.addEventSourceMapping('KafkaEventSource', {
+        kafkaBootstrapServers: kafkaBootstrapServers.split(','),
+        kafkaTopic: FlightPulseConstants.KAFKA_TOPIC,
+        startingPosition: lambda.StartingPosition.LATEST,
+        batchSize: 100,
+        // The handler skips malformed and rejected records and raises only when
+        // publishing still fails after in-process retries, so a failed invocation
+        // retries the whole batch
+        onFailure: new lambdaEventSources.SqsDlq(kafkaFailureQueue),
+        sourceAccessConfigurations: [
+          ...network.vpc.isolatedSubnets.map((subnet) => ({
+            type: lambda.SourceAccessConfigurationType.VPC_SUBNET,
+            uri: `subnet:${subnet.subnetId}`,
+          })),
+          {
+            type: lambda.SourceAccessConfigurationType.VPC_SECURITY_GROUP,
+            uri: `security_group:${network.lambdaSecurityGroup.securityGroupId}`,
+          },
+        ],
+      });
+    }
+
     // LLM Messenger Lambda (Python)
     const llmMessenger = new lambda.Function(this, 'LLMMessenger', {
       runtime: lambda.Runtime.PYTHON_3_11,
@@ -132,6 +170,16 @@ export class FlightPulseStack extends cdk.Stack {
     table.grantReadData(llmMessenger);
     bedrockModelParam.grantRead(llmMessenger); // Grant read access to SSM parameter
 
+    // Workflows invoke the LLM Messenger through an alias with provisioned concurrency
+    // so latency-sensitive notification generation does not pay for cold starts
+    const llmMessengerAlias = new lambda.Alias(this, 'LLMMessengerAlias', {
+      aliasName: FlightPulseConstants.LLM_MESSENGER_ALIAS,
+      version: llmMessenger.currentVersion,
+      provisionedConcurrentExecutions: Number(
+        this.node.tryGetContext('llmProvisionedConcurrency') ?? FlightPulseConstants.LLM_MESSENGER_PROVISIONED_CONCURRENCY
+      ),
+    });
+
     // API Handlers Lambda (Node.js)
     const apiHandlers = new lambda.Function(this, 'ApiHandlers', {
       runtime: lambda.Runtime.NODEJS_20_X,
@@ -162,6 +210,7 @@ export class FlightPulseStack extends cdk.Stack {
         this.getNodeJsBundlingOptions()
       ),
       environment: {
+        TABLE_NAME: table.tableName,
         EVENT_BUS_NAME: eventBus.eventBusName,
       },
       timeout: cdk.Duration.seconds(30),
@@ -173,6 +222,7 @@ export class FlightPulseStack extends cdk.Stack {
     });
 
     eventBus.grantPutEventsTo(streamHandler);
+    table.grantReadWriteData(streamHandler); // Recounts bookings into FLIGHT#<id>/COUNTERS
 
     // DynamoDB Stream → Stream Handler
     streamHandler.addEventSourceMapping('StreamEventSource', {
@@ -182,9 +232,9 @@ export class FlightPulseStack extends cdk.Stack {
     });
 
     // Step Functions State Machines
-    const delayWorkflow = this.createDelayWorkflow(this, table, llmMessenger, eventBus, dlq, errorTopic);
-    const cancellationWorkflow = this.createCancellationWorkflow(this, table, llmMessenger, eventBus, dlq, errorTopic);
-    const gateChangeWorkflow = this.createGateChangeWorkflow(this, table, llmMessenger, eventBus, dlq, errorTopic);
+    const delayWorkflow = this.createDelayWorkflow(this, table, llmMessengerAlias, eventBus, dlq, errorTopic);
+    const cancellationWorkflow = this.createCancellationWorkflow(this, table, llmMessengerAlias, eventBus, dlq, errorTopic);
+    const gateChangeWorkflow = this.createGateChangeWorkflow(this, table, llmMessengerAlias, eventBus, dlq, errorTopic);
 
     // EventBridge Rules
     new events.Rule(this, 'DelayMinorRule', {
@@ -381,7 +431,7 @@ export class FlightPulseStack extends cdk.Stack {
   private createDelayWorkflow(
     scope: Construct,
     table: dynamodb.Table,
-    llmMessenger: lambda.Function,
+    llmMessenger: lambda.IFunction,
     eventBus: events.EventBus,
     dlq: sqs.Queue,
     errorTopic: sns.Topic
@@ -473,7 +523,7 @@ export class FlightPulseStack extends cdk.Stack {
   private createProcessBookingsMap(
     scope: Construct,
     table: dynamodb.Table,
-    llmMessenger: lambda.Function,
+    llmMessenger: lambda.IFunction,
     eventBus: events.EventBus,
     messageType: string = 'DELAY_NOTIFICATION'
   ): sfn.Map {
@@ -557,7 +607,7 @@ export class FlightPulseStack extends cdk.Stack {
   private createCancellationWorkflow(
     scope: Construct,
     table: dynamodb.Table,
-    llmMessenger: lambda.Function,
+    llmMessenger: lambda.IFunction,
     eventBus: events.EventBus,
     dlq: sqs.Queue,
     errorTopic: sns.Topic
@@ -636,7 +686,7 @@ export class FlightPulseStack extends cdk.Stack {
   private createGateChangeWorkflow(
     scope: Construct,
     table: dynamodb.Table,
-    llmMessenger: lambda.Function,
+    llmMessenger: lambda.IFunction,
     eventBus: events.EventBus,
     dlq: sqs.Queue,
     errorTopic: sns.Topic
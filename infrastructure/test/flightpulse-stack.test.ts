@@ -78,6 +78,15 @@ describe('FlightPulseStack', () => {
             });
         });
 
+        test('LLM Messenger alias has provisioned concurrency', () => {
+            template.hasResourceProperties('AWS::Lambda::Alias', {
+                Name: 'live',
+                ProvisionedConcurrencyConfig: {
+                    ProvisionedConcurrentExecutions: 1,
+                },
+            });
+        });
+
         test('all Lambdas are in VPC', () => {
             const lambdas = template.findResources('AWS::Lambda::Function');
             Object.values(lambdas).forEach((lambda: any) => {
@@ -192,6 +201,39 @@ describe('FlightPulseStack', () => {
         });
     });
 
+    describe('Kafka Event Source', () => {
+        test('no Kafka event source mapping without bootstrap servers', () => {
+            const mappings = template.findResources('AWS::Lambda::EventSourceMapping', {
+                Properties: { Topics: ['flight-operations'] },
+            });
+            expect(Object.keys(mappings).length).toBe(0);
+        });
+
+        test('creates Kafka event source mapping from bootstrap servers', () => {
+            const kafkaApp = new cdk.App({
+                context: {
+                    kafkaBootstrapServers: 'broker-1:9092,broker-2:9092',
+                },
+            });
+            const kafkaTemplate = Template.fromStack(new FlightPulseStack(kafkaApp, 'KafkaStack'));
+
+            kafkaTemplate.hasResourceProperties('AWS::Lambda::EventSourceMapping', {
+                Topics: ['flight-operations'],
+                SelfManagedEventSource: {
+                    Endpoints: {
+                        KafkaBootstrapServers: ['broker-1:9092', 'broker-2:9092'],
+                    },
+                },
+                DestinationConfig: {
+                    OnFailure: { Destination: Match.anyValue() },
+                },
+            });
+            // STS interface endpoint is only added for the Kafka mapping
+            expect(Object.keys(kafkaTemplate.findResources('AWS::EC2::VPCEndpoint')).length)
+                .toBe(Object.keys(template.findResources('AWS::EC2::VPCEndpoint')).length + 1);
+        });
+    });
+
     describe('SSM Parameter Store', () => {
         test('creates parameter for Bedrock model ID', () => {
             template.hasResourceProperties('AWS::SSM::Parameter', {
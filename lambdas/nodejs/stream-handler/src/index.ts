@@ -1,8 +1,11 @@
 import { DynamoDBStreamEvent, DynamoDBStreamHandler } from 'aws-lambda';
 import { EventBridgeClient, PutEventsCommand } from '@aws-sdk/client-eventbridge';
+import { DynamoDBClient, QueryCommand, UpdateItemCommand } from '@aws-sdk/client-dynamodb';
 
 const eventBridge = new EventBridgeClient({});
+const dynamoDb = new DynamoDBClient({});
 const EVENT_BUS_NAME = process.env.EVENT_BUS_NAME!;
+const TABLE_NAME = process.env.TABLE_NAME!;
 
 // Structured Logger
 const logger = {
@@ -11,11 +14,67 @@ const logger = {
   warn: (message: string, data?: any) => console.warn(JSON.stringify({ level: 'WARN', message, ...data })),
 };
 
+/**
+ * Recount a flight's BOOKING# items and SET the result on FLIGHT#<id>/COUNTERS
+ * so consumers can read booking_count instead of counting bookings.
+ *
+ * Recounting (rather than ADD +/-1) is idempotent: batch retries cannot double
+ * count, and a failed update is corrected by the next booking change for the
+ * flight (or by scripts/backfill-booking-counters.py).
+ */
+const refreshBookingCount = async (flightPk: string): Promise<void> => {
+  let count = 0;
+  let exclusiveStartKey: Record<string, any> | undefined;
+  do {
+    const response = await dynamoDb.send(
+      new QueryCommand({
+        TableName: TABLE_NAME,
+        KeyConditionExpression: 'PK = :pk AND begins_with(SK, :sk)',
+        ExpressionAttributeValues: {
+          ':pk': { S: flightPk },
+          ':sk': { S: 'BOOKING#' },
+        },
+        Select: 'COUNT',
+        ConsistentRead: true,
+        ExclusiveStartKey: exclusiveStartKey,
+      })
+    );
+    count += response.Count ?? 0;
+    exclusiveStartKey = response.LastEvaluatedKey;
+  } while (exclusiveStartKey);
+
+  await dynamoDb.send(
+    new UpdateItemCommand({
+      TableName: TABLE_NAME,
+      Key: {
+        PK: { S: flightPk },
+        SK: { S: 'COUNTERS' },
+      },
+      UpdateExpression: 'SET booking_count = :count',
+      ExpressionAttributeValues: {
+        ':count': { N: String(count) },
+      },
+    })
+  );
+};
+
 export const handler: DynamoDBStreamHandler = async (event: DynamoDBStreamEvent) => {
   logger.info('Processing stream records', { count: event.Records.length });
 
+  // Flights whose bookings were added or removed; recounted once per batch
+  const changedFlights = new Set<string>();
+
   for (const record of event.Records) {
     try {
+      if (record.eventName === 'INSERT' || record.eventName === 'REMOVE') {
+        const pk = record.dynamodb?.Keys?.PK?.S || '';
+        const sk = record.dynamodb?.Keys?.SK?.S || '';
+
+        if (pk.startsWith('FLIGHT#') && sk.startsWith('BOOKING#')) {
+          changedFlights.add(pk);
+        }
+      }
+
       if (record.eventName === 'MODIFY' || record.eventName === 'INSERT') {
         const newImage = record.dynamodb?.NewImage;
         const oldImage = record.dynamodb?.OldImage;
@@ -58,5 +117,13 @@ export const handler: DynamoDBStreamHandler = async (event: DynamoDBStreamEvent)
       // Continue processing other records
     }
   }
+
+  for (const flightPk of changedFlights) {
+    try {
+      await refreshBookingCount(flightPk);
+    } catch (error: any) {
+      logger.error('Error refreshing booking count', { flightPk, error });
+    }
+  }
 };
 
@@ -1,8 +1,14 @@
-import json
+import base64
 import os
+import time
 import boto3
+import orjson
+from boto3.dynamodb.types import TypeDeserializer
+from botocore.config import Config
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 from aws_lambda_powertools import Logger, Tracer, Metrics
 from aws_lambda_powertools.metrics import MetricUnit
 
@@ -10,12 +16,70 @@ logger = Logger()
 tracer = Tracer()
 metrics = Metrics()
 
-eventbridge = boto3.client('events')
-dynamodb = boto3.resource('dynamodb')
+# tcp_keepalive turns on SO_KEEPALIVE probes for pooled sockets; adaptive
+# retries add client-side backoff when DynamoDB or EventBridge throttle
+boto_config = Config(
+    tcp_keepalive=True,
+    retries={'mode': 'adaptive', 'max_attempts': 3},
+    max_pool_connections=50,
+)
+
+eventbridge = boto3.client('events', config=boto_config)
+# Low-level client rather than a resource: boto3 clients are thread-safe, while
+# resource instances must not be shared across io_pool's threads
+dynamodb = boto3.client('dynamodb', config=boto_config)
+deserializer = TypeDeserializer()
+
+# Overlaps independent DynamoDB requests; the connection pool above is sized
+# well beyond this many workers
+io_pool = ThreadPoolExecutor(max_workers=8)
 
 TABLE_NAME = os.environ['TABLE_NAME']
 EVENT_BUS_NAME = os.environ['EVENT_BUS_NAME']
-table = dynamodb.Table(TABLE_NAME)
+
+# DynamoDB BatchGetItem accepts at most 100 keys per request
+BATCH_GET_MAX_KEYS = 100
+BATCH_GET_MAX_RETRIES = 3
+
+# Only the attributes enrichment reads; BatchGetItem applies one projection to
+# every key, so it spans both METADATA and COUNTERS items
+FLIGHT_ITEM_PROJECTION = {
+    'ProjectionExpression': '#pk, #sk, #origin, #destination, #departure, #booking_count',
+    'ExpressionAttributeNames': {
+        '#pk': 'PK',
+        '#sk': 'SK',
+        '#origin': 'origin',
+        '#destination': 'destination',
+        '#departure': 'scheduled_departure',
+        '#booking_count': 'booking_count',
+    },
+}
+
+class PublishError(RuntimeError):
+    """Raised to have a Kafka batch redelivered after EventBridge rejected events."""
+
+
+# EventBridge PutEvents accepts at most 10 entries per request
+PUT_EVENTS_MAX_ENTRIES = 10
+PUT_EVENTS_MAX_RETRIES = 3
+# Entry errors that may succeed on retry; any other ErrorCode (e.g. MalformedDetail)
+# fails the same way every time
+RETRYABLE_PUT_EVENTS_ERRORS = frozenset({'InternalFailure', 'ThrottlingException'})
+
+# Event types whose EventBridge payload needs DynamoDB enrichment
+ENRICHED_EVENT_TYPES = ('FLIGHT_DELAY', 'FLIGHT_CANCELLED')
+
+# Per-invocation counters published once per batch rather than once per event
+PROCESSED_METRIC_NAMES = {
+    'FLIGHT_DELAY': 'DelayEventsProcessed',
+    'FLIGHT_CANCELLED': 'CancellationEventsProcessed',
+    'GATE_CHANGE': 'GateChangeEventsProcessed',
+}
+
+# Flight context cached for the lifetime of the Lambda container (LRU-bounded)
+FLIGHT_CACHE_TTL_SECONDS = 300
+FLIGHT_CACHE_MAX_ENTRIES = 1024
+_flight_cache: 'OrderedDict[str, Tuple[float, Dict[str, Any]]]' = OrderedDict()
 
 
 def categorize_delay(delay_minutes: int) -> str:
@@ -28,148 +92,395 @@ def categorize_delay(delay_minutes: int) -> str:
         return 'severe'
 
 
-def enrich_flight_details(flight_id: str) -> Dict[str, Any]:
-    """Fetch flight details from DynamoDB."""
-    try:
-        response = table.get_item(
-            Key={
-                'PK': f'FLIGHT#{flight_id}',
-                'SK': 'METADATA'
-            }
+def record_identifier(record: Dict[str, Any]) -> str:
+    """Identify an MSK record by topic, partition and offset for logging."""
+    return f"{record['topic']}-{record['partition']}@{record['offset']}"
+
+
+def skip_invalid_record(identifier: str, reason: Any) -> None:
+    """Log and count a record that would fail identically on every retry."""
+    logger.error(f"Skipping invalid record {identifier}: {reason}")
+    metrics.add_metric(name='InvalidRecords', unit=MetricUnit.Count, value=1)
+
+
+def parse_kafka_events(event: Dict[str, Any]) -> List[Tuple[str, Dict[str, Any]]]:
+    """Extract (record identifier, Kafka event) pairs from the Lambda event.
+
+    MSK event source mappings deliver a batch of base64-encoded records keyed
+    by topic-partition; records that are not a JSON object with an object
+    ``payload`` (with a string ``flight_id``, if any) are skipped. Direct invocations (API Gateway, manual testing)
+    carry a single event in ``body``.
+    """
+    if 'records' in event:
+        kafka_events = []
+        for partition_records in event['records'].values():
+            for record in partition_records:
+                identifier = record_identifier(record)
+                try:
+                    kafka_event = orjson.loads(base64.b64decode(record['value']))
+                except Exception as e:
+                    skip_invalid_record(identifier, e)
+                    continue
+                if not isinstance(kafka_event, dict) or not isinstance(kafka_event.get('payload', {}), dict):
+                    skip_invalid_record(identifier, 'expected a JSON object with an object payload')
+                    continue
+                flight_id = kafka_event.get('payload', {}).get('flight_id')
+                if flight_id is not None and not isinstance(flight_id, str):
+                    skip_invalid_record(identifier, 'flight_id must be a string')
+                    continue
+                kafka_events.append((identifier, kafka_event))
+        return kafka_events
+
+    # For API Gateway integration, event body is a string
+    if isinstance(event.get('body'), str):
+        return [('body', orjson.loads(event.get('body') or '{}'))]
+    return [('body', event.get('body', event))]
+
+
+def _batch_get_chunk(keys: List[Dict[str, Dict[str, str]]]) -> List[Dict[str, Any]]:
+    """Run one BatchGetItem request, retrying UnprocessedKeys with backoff."""
+    items: List[Dict[str, Any]] = []
+    request_items = {TABLE_NAME: {'Keys': keys, **FLIGHT_ITEM_PROJECTION}}
+    attempt = 0
+    while request_items:
+        try:
+            response = dynamodb.batch_get_item(RequestItems=request_items)
+        except Exception as e:
+            logger.error(f"Error fetching flight details: {e}")
+            break
+
+        items.extend(
+            {name: deserializer.deserialize(value) for name, value in item.items()}
+            for item in response.get('Responses', {}).get(TABLE_NAME, [])
         )
-        if 'Item' in response:
-            return {
-                'origin': response['Item'].get('origin'),
-                'destination': response['Item'].get('destination'),
-                'original_departure': response['Item'].get('scheduled_departure'),
-            }
-    except Exception as e:
-        logger.error(f"Error fetching flight details: {e}")
-    return {}
 
+        request_items = response.get('UnprocessedKeys') or {}
+        if request_items:
+            attempt += 1
+            if attempt > BATCH_GET_MAX_RETRIES:
+                logger.warning(f"Giving up on unprocessed flight keys after {BATCH_GET_MAX_RETRIES} retries")
+                break
+            time.sleep(0.05 * 2 ** attempt)
+
+    return items
+
+
+def batch_get_flight_items(flight_ids: Iterable[str]) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """Fetch METADATA and COUNTERS items for many flights with BatchGetItem.
+
+    Returns items keyed by flight ID, then by sort key.
+    """
+    keys = [
+        {'PK': {'S': f'FLIGHT#{flight_id}'}, 'SK': {'S': sk}}
+        for flight_id in flight_ids
+        for sk in ('METADATA', 'COUNTERS')
+    ]
+    chunks = [keys[start:start + BATCH_GET_MAX_KEYS] for start in range(0, len(keys), BATCH_GET_MAX_KEYS)]
+    # Chunks are independent requests, so large batches fetch them concurrently
+    results = io_pool.map(_batch_get_chunk, chunks) if len(chunks) > 1 else map(_batch_get_chunk, chunks)
 
-def count_affected_passengers(flight_id: str) -> int:
-    """Count bookings for a flight."""
+    flight_items: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    for items in results:
+        for item in items:
+            flight_items.setdefault(item['PK'].split('#', 1)[1], {})[item['SK']] = item
+    return flight_items
+
+
+def count_affected_passengers(flight_id: str) -> Optional[int]:
+    """Count bookings for a flight, or None if the query failed.
+
+    Only used when the flight has no COUNTERS item yet (e.g. before the
+    booking counter backfill has run).
+    """
     try:
-        response = table.query(
+        response = dynamodb.query(
+            TableName=TABLE_NAME,
             KeyConditionExpression='PK = :pk AND begins_with(SK, :sk)',
             ExpressionAttributeValues={
-                ':pk': f'FLIGHT#{flight_id}',
-                ':sk': 'BOOKING#'
+                ':pk': {'S': f'FLIGHT#{flight_id}'},
+                ':sk': {'S': 'BOOKING#'}
             },
             Select='COUNT'
         )
         return response.get('Count', 0)
     except Exception as e:
         logger.error(f"Error counting passengers: {e}")
-        return 0
+        return None
+
+
+def get_cached_flight_context(flight_id: str, now: float) -> Optional[Dict[str, Any]]:
+    """Return cached flight context if present and not expired."""
+    entry = _flight_cache.get(flight_id)
+    if entry is None:
+        return None
+    if now - entry[0] >= FLIGHT_CACHE_TTL_SECONDS:
+        del _flight_cache[flight_id]
+        return None
+    _flight_cache.move_to_end(flight_id)
+    return entry[1]
+
+
+def cache_flight_context(flight_id: str, flight_context: Dict[str, Any], now: float) -> None:
+    """Store flight context, evicting the least recently used entry when full."""
+    _flight_cache[flight_id] = (now, flight_context)
+    _flight_cache.move_to_end(flight_id)
+    while len(_flight_cache) > FLIGHT_CACHE_MAX_ENTRIES:
+        _flight_cache.popitem(last=False)
+
+
+def load_flight_context(flight_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """Load flight details and affected passenger counts for a batch of flights.
+
+    Flights seen recently by this container are served from memory. Metadata
+    and the denormalized booking counter for the rest are fetched in a single
+    BatchGetItem call (chunked at the API limit).
+    """
+    now = time.time()
+    result: Dict[str, Dict[str, Any]] = {}
+    missing = []
+    for flight_id in dict.fromkeys(fid for fid in flight_ids if fid):
+        cached = get_cached_flight_context(flight_id, now)
+        if cached is not None:
+            result[flight_id] = cached
+        else:
+            missing.append(flight_id)
+
+    if not missing:
+        return result
+
+    flight_items = batch_get_flight_items(missing)
+
+    # Known flights without a booking counter yet are counted concurrently
+    uncounted = [
+        fid for fid in missing
+        if 'METADATA' in flight_items.get(fid, {}) and 'COUNTERS' not in flight_items[fid]
+    ]
+    counts = dict(zip(uncounted, io_pool.map(count_affected_passengers, uncounted)))
+
+    for flight_id in missing:
+        items = flight_items.get(flight_id, {})
+        metadata = items.get('METADATA')
+        counters = items.get('COUNTERS')
+        count = int(counters.get('booking_count', 0)) if counters else counts.get(flight_id, 0)
+
+        result[flight_id] = {
+            'flight_details': {
+                'origin': metadata.get('origin'),
+                'destination': metadata.get('destination'),
+                'original_departure': metadata.get('scheduled_departure'),
+            } if metadata else {},
+            'affected_passengers_count': count or 0,
+        }
+        # Only cache flights that were found and counted so lookup failures are retried
+        if metadata and count is not None:
+            cache_flight_context(flight_id, result[flight_id], now)
+
+    return result
+
+
+def _entry(detail_type: str, detail: Dict[str, Any]) -> Dict[str, Any]:
+    """Wrap an event detail in the PutEvents entry shape."""
+    return {
+        'EventBusName': EVENT_BUS_NAME,
+        'Source': 'flightpulse.kafka-consumer',
+        'DetailType': detail_type,
+        'Detail': orjson.dumps(detail).decode(),
+    }
+
+
+def _build_delay(kafka_event: Dict[str, Any], payload: Dict[str, Any], flight_id: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    delay_minutes = payload.get('delay_minutes', 0)
+    category = categorize_delay(delay_minutes)
+    return _entry(f'flight.delay.{category}', {
+        'event_id': kafka_event.get('event_id'),
+        'flight_id': flight_id,
+        'delay_minutes': delay_minutes,
+        'delay_category': category.upper(),
+        'reason': payload.get('reason'),
+        'reason_detail': payload.get('reason_detail'),
+        'affected_passengers_count': context.get('affected_passengers_count', 0),
+        'new_departure': payload.get('new_departure'),
+        'new_arrival': payload.get('new_arrival'),
+        'flight_details': context.get('flight_details', {}),
+        'timestamp': kafka_event.get('timestamp') or datetime.utcnow().isoformat(),
+    })
+
+
+def _build_cancel(kafka_event: Dict[str, Any], payload: Dict[str, Any], flight_id: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    return _entry('flight.cancelled', {
+        'event_id': kafka_event.get('event_id'),
+        'flight_id': flight_id,
+        'reason': payload.get('reason'),
+        'reason_detail': payload.get('reason_detail'),
+        'rebooking_priority': payload.get('rebooking_priority'),
+        'affected_passengers_count': context.get('affected_passengers_count', 0),
+        'timestamp': kafka_event.get('timestamp') or datetime.utcnow().isoformat(),
+    })
+
+
+def _build_gate(kafka_event: Dict[str, Any], payload: Dict[str, Any], flight_id: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    return _entry('flight.gate_change', {
+        'event_id': kafka_event.get('event_id'),
+        'flight_id': flight_id,
+        'old_gate': payload.get('old_gate'),
+        'new_gate': payload.get('new_gate'),
+        'terminal_change': payload.get('terminal_change', False),
+        'timestamp': kafka_event.get('timestamp') or datetime.utcnow().isoformat(),
+    })
+
+
+_BUILDERS = {
+    'FLIGHT_DELAY': _build_delay,
+    'FLIGHT_CANCELLED': _build_cancel,
+    'GATE_CHANGE': _build_gate,
+}
+
+
+def build_eventbridge_event(kafka_event: Dict[str, Any], flight_context: Dict[str, Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Shape a Kafka event into a PutEvents entry, or None if its type is unknown."""
+    event_type = kafka_event.get('event_type')
+    payload = kafka_event.get('payload', {})
+    flight_id = payload.get('flight_id')
+
+    logger.debug("Processing %s for flight %s", event_type, flight_id)
+
+    builder = _BUILDERS.get(event_type)
+    if builder is None:
+        logger.warning("Unknown event type: %s", event_type)
+        return None
+
+    return builder(kafka_event, payload, flight_id, flight_context.get(flight_id, {}))
+
+
+def _put_events_chunk(chunk: List[Tuple[str, Dict[str, Any]]]) -> Tuple[List[str], List[str]]:
+    """Publish one PutEvents chunk, retrying retryable entry errors with backoff.
+
+    Returns identifiers of rejected records (non-retryable errors, skipped) and
+    of records that still failed after retries.
+    """
+    rejected: List[str] = []
+    attempt = 0
+    while True:
+        response = eventbridge.put_events(Entries=[entry for _, entry in chunk])
+        if not response.get('FailedEntryCount', 0):
+            return rejected, []
+
+        retry = []
+        # Result entries are returned in the same order as the request entries
+        for (identifier, entry), result in zip(chunk, response.get('Entries', [])):
+            error_code = result.get('ErrorCode')
+            if not error_code:
+                continue
+            if error_code in RETRYABLE_PUT_EVENTS_ERRORS:
+                retry.append((identifier, entry))
+            else:
+                skip_invalid_record(identifier, f"{error_code} {result.get('ErrorMessage')}")
+                rejected.append(identifier)
+
+        chunk = retry
+        if not chunk:
+            return rejected, []
+        attempt += 1
+        if attempt > PUT_EVENTS_MAX_RETRIES:
+            for identifier, _ in chunk:
+                logger.error(f"Failed to publish {identifier} after {PUT_EVENTS_MAX_RETRIES} retries")
+            return rejected, [identifier for identifier, _ in chunk]
+        time.sleep(0.05 * 2 ** attempt)
+
+
+def publish_events(entries: List[Tuple[str, Dict[str, Any]]]) -> Tuple[List[str], List[str]]:
+    """Publish EventBridge entries in batches.
+
+    Returns identifiers of rejected records and of records left unpublished.
+    Publishing stops at the first chunk that still fails, so that chunk and
+    every later one are reported as unpublished.
+    """
+    rejected: List[str] = []
+    for start in range(0, len(entries), PUT_EVENTS_MAX_ENTRIES):
+        chunk = entries[start:start + PUT_EVENTS_MAX_ENTRIES]
+        try:
+            chunk_rejected, chunk_failed = _put_events_chunk(chunk)
+        except Exception as e:
+            logger.error(f"Error publishing events to EventBridge: {e}")
+            chunk_rejected, chunk_failed = [], [identifier for identifier, _ in chunk]
+        rejected.extend(chunk_rejected)
+        if chunk_failed:
+            return rejected, chunk_failed + [identifier for identifier, _ in entries[start + PUT_EVENTS_MAX_ENTRIES:]]
+
+        logger.debug("Published %d events to EventBridge", len(chunk) - len(chunk_rejected))
+
+    return rejected, []
 
 
 @tracer.capture_lambda_handler
 @logger.inject_lambda_context
 @metrics.log_metrics
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
-    """Process Kafka events and publish to EventBridge."""
+    """Process a batch of Kafka events and publish them to EventBridge."""
+    is_batch = 'records' in event
     try:
-        # Parse Kafka event (simplified - adjust based on your Kafka integration)
-        # For API Gateway integration, event body is a string
-        if isinstance(event.get('body'), str):
-            kafka_event = json.loads(event.get('body', '{}'))
-        else:
-            kafka_event = event.get('body', event)
-        
-        event_type = kafka_event.get('event_type')
-        payload = kafka_event.get('payload', {})
-        flight_id = payload.get('flight_id')
-        
-        logger.info(f"Processing {event_type} for flight {flight_id}")
-        
-        if event_type == 'FLIGHT_DELAY':
-            delay_minutes = payload.get('delay_minutes', 0)
-            category = categorize_delay(delay_minutes)
-            detail_type = f'flight.delay.{category}'
-            
-            # Enrich event
-            flight_details = enrich_flight_details(flight_id)
-            affected_count = count_affected_passengers(flight_id)
-            
-            eventbridge_event = {
-                'source': 'flightpulse.kafka-consumer',
-                'detail-type': detail_type,
-                'detail': {
-                    'event_id': kafka_event.get('event_id'),
-                    'flight_id': flight_id,
-                    'delay_minutes': delay_minutes,
-                    'delay_category': category.upper(),
-                    'reason': payload.get('reason'),
-                    'reason_detail': payload.get('reason_detail'),
-                    'affected_passengers_count': affected_count,
-                    'new_departure': payload.get('new_departure'),
-                    'new_arrival': payload.get('new_arrival'),
-                    'flight_details': flight_details,
-                    'timestamp': kafka_event.get('timestamp', datetime.utcnow().isoformat()),
-                }
-            }
-            
-            metrics.add_metric(name='DelayEventsProcessed', unit=MetricUnit.Count, value=1)
-            
-        elif event_type == 'FLIGHT_CANCELLED':
-            eventbridge_event = {
-                'source': 'flightpulse.kafka-consumer',
-                'detail-type': 'flight.cancelled',
-                'detail': {
-                    'event_id': kafka_event.get('event_id'),
-                    'flight_id': flight_id,
-                    'reason': payload.get('reason'),
-                    'reason_detail': payload.get('reason_detail'),
-                    'rebooking_priority': payload.get('rebooking_priority'),
-                    'affected_passengers_count': count_affected_passengers(flight_id),
-                    'timestamp': kafka_event.get('timestamp', datetime.utcnow().isoformat()),
-                }
-            }
-            
-            metrics.add_metric(name='CancellationEventsProcessed', unit=MetricUnit.Count, value=1)
-            
-        elif event_type == 'GATE_CHANGE':
-            eventbridge_event = {
-                'source': 'flightpulse.kafka-consumer',
-                'detail-type': 'flight.gate_change',
-                'detail': {
-                    'event_id': kafka_event.get('event_id'),
-                    'flight_id': flight_id,
-                    'old_gate': payload.get('old_gate'),
-                    'new_gate': payload.get('new_gate'),
-                    'terminal_change': payload.get('terminal_change', False),
-                    'timestamp': kafka_event.get('timestamp', datetime.utcnow().isoformat()),
-                }
-            }
-            
-            metrics.add_metric(name='GateChangeEventsProcessed', unit=MetricUnit.Count, value=1)
-            
-        else:
-            logger.warning(f"Unknown event type: {event_type}")
-            return {'statusCode': 400, 'body': json.dumps({'error': 'Unknown event type'})}
-        
-        # Publish to EventBridge
-        response = eventbridge.put_events(
-            Entries=[{
-                'EventBusName': EVENT_BUS_NAME,
-                **eventbridge_event
-            }]
+        kafka_events = parse_kafka_events(event)
+
+        # Enrich every flight in the batch up front instead of per event
+        flight_context = load_flight_context(
+            kafka_event.get('payload', {}).get('flight_id')
+            for _, kafka_event in kafka_events
+            if kafka_event.get('event_type') in ENRICHED_EVENT_TYPES
         )
-        
-        logger.info(f"Published event to EventBridge: {response}")
-        
+
+        entries = []
+        event_types = {}
+        errors = 0
+        for identifier, kafka_event in kafka_events:
+            try:
+                eventbridge_event = build_eventbridge_event(kafka_event, flight_context)
+            except Exception as e:
+                # Bad field values fail the same way on redelivery, so drop the record
+                logger.error(f"Error processing record {identifier}: {e}", exc_info=True)
+                errors += 1
+                continue
+            if eventbridge_event is not None:
+                entries.append((identifier, eventbridge_event))
+                event_types[identifier] = kafka_event['event_type']
+
+        if errors:
+            metrics.add_metric(name='ProcessingErrors', unit=MetricUnit.Count, value=errors)
+
+        rejected, publish_failed = publish_events(entries)
+        if publish_failed:
+            metrics.add_metric(name='PublishErrors', unit=MetricUnit.Count, value=len(publish_failed))
+            if is_batch:
+                # Kafka event source mappings have no partial batch response; failing
+                # the invocation stops the offsets being committed and the whole batch
+                # is retried, so chunks published before the failure are sent again
+                raise PublishError(f"Failed to publish {len(publish_failed)} of {len(entries)} events")
+
+        # Counted only once published, so redelivered batches are not counted twice
+        published = set(event_types).difference(rejected, publish_failed)
+        for event_type, count in Counter(event_types[identifier] for identifier in published).items():
+            metrics.add_metric(name=PROCESSED_METRIC_NAMES[event_type], unit=MetricUnit.Count, value=count)
+
+        if not is_batch:
+            if errors or rejected or publish_failed:
+                return {'statusCode': 500, 'body': orjson.dumps({'error': 'Failed to process event'}).decode()}
+            if kafka_events and not entries:
+                return {'statusCode': 400, 'body': orjson.dumps({'error': 'Unknown event type'}).decode()}
+
         return {
             'statusCode': 200,
-            'body': json.dumps({'message': 'Event processed successfully'})
+            'body': orjson.dumps({'message': 'Event processed successfully', 'processed': len(published)}).decode()
         }
-        
+
+    except PublishError as e:
+        # Already counted as PublishErrors
+        logger.error(f"Error processing batch: {e}")
+        raise
     except Exception as e:
         logger.error(f"Error processing event: {e}", exc_info=True)
         metrics.add_metric(name='ProcessingErrors', unit=MetricUnit.Count, value=1)
+        if is_batch:
+            raise
         return {
             'statusCode': 500,
-            'body': json.dumps({'error': str(e)})
+            'body': orjson.dumps({'error': str(e)}).decode()
         }
-
@@ -1,6 +1,8 @@
-import json
 import os
+import re
 import boto3
+import orjson
+from botocore.config import Config
 from typing import Dict, Any
 from aws_lambda_powertools import Logger, Tracer, Metrics
 from aws_lambda_powertools.metrics import MetricUnit
@@ -9,23 +11,88 @@ logger = Logger()
 tracer = Tracer()
 metrics = Metrics()
 
-bedrock = boto3.client('bedrock-runtime')
-ssm = boto3.client('ssm')
+boto_config = Config(
+    tcp_keepalive=True,
+    retries={'mode': 'adaptive', 'max_attempts': 3},
+    max_pool_connections=50,
+)
+
+bedrock = boto3.client('bedrock-runtime', config=boto_config)
+# SSM is only read at cold start; fail fast and fall back to the default model
+# rather than blocking initialisation when Parameter Store is slow
+ssm = boto3.client('ssm', config=boto_config.merge(Config(
+    connect_timeout=1,
+    read_timeout=2,
+    retries={'mode': 'standard', 'max_attempts': 1},
+)))
 
 # Read model ID from SSM Parameter Store (more secure than environment variable)
 BEDROCK_MODEL_PARAM = os.environ.get('BEDROCK_MODEL_PARAM', '/flightpulse/bedrock/model-id')
+DEFAULT_MODEL_ID = 'anthropic.claude-3-haiku-20240307-v1:0'
+
+# Enough for subject, 2-3 short paragraphs and an SMS; Bedrock latency grows
+# with generated tokens, so keep this close to what the response needs
+MAX_TOKENS = 400
+
+
+# Set on the first successful SSM read and kept for the container lifetime
+_model_id = None
+
 
 def get_model_id() -> str:
-    """Retrieve Bedrock model ID from SSM Parameter Store."""
-    try:
-        response = ssm.get_parameter(Name=BEDROCK_MODEL_PARAM, WithDecryption=True)
-        return response['Parameter']['Value']
-    except Exception as e:
-        logger.warning(f"Failed to retrieve model ID from SSM: {e}, using default")
-        return 'anthropic.claude-3-haiku-20240307-v1:0'
+    """Retrieve Bedrock model ID from SSM Parameter Store.
+
+    Only a successful lookup is cached; after a failure the default model is
+    used for that invocation and SSM is asked again on the next one.
+    """
+    global _model_id
+    if _model_id is None:
+        try:
+            response = ssm.get_parameter(Name=BEDROCK_MODEL_PARAM, WithDecryption=True)
+            _model_id = response['Parameter']['Value']
+        except Exception as e:
+            logger.warning(f"Failed to retrieve model ID from SSM: {e}, using default")
+            return DEFAULT_MODEL_ID
+    return _model_id
+
+# Provisioned concurrency runs init ahead of traffic, so resolve the model ID there;
+# on-demand cold starts defer the SSM call to the first invocation that needs it
+if os.environ.get('AWS_LAMBDA_INITIALIZATION_TYPE') == 'provisioned-concurrency':
+    get_model_id()
+
+# Extracts the JSON object from the LLM response text
+_JSON_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+# Fixed instructions live in the system prompt and per-request fields in the
+# user message. This is organisational only: no cache_control is sent, and
+# Claude 3 Haiku on Bedrock cannot cache a prefix this short, so it saves
+# neither latency nor cost
+SYSTEM_PROMPT = """You generate personalized, empathetic notification messages for airline passengers.
+
+Always:
+- Address the passenger by first name
+- Include actionable next steps
+- Keep the SMS under 160 characters
+
+Respond with a JSON object with:
+- email_subject: Brief subject line
+- email_body: 2-3 paragraph message
+- sms_body: Concise message under 160 chars"""
+
+PROMPT_TEMPLATE = """Passenger Details:
+- Name: {first_name}
+- Tier: {tier}
+- Special Requests: {special_requests}
 
-# Cache model ID for the lifetime of the Lambda container
-MODEL_ID = get_model_id()
+Flight Event:
+- Type: {message_type}
+- Flight ID: {flight_id}
+- Details: {flight_details}
+
+Requirements:
+1. {tier_instruction}
+2. Adjust tone: {tone}{special_instruction}
+"""
 
 
 def generate_template_message(passenger: Dict[str, Any], flight_event: Dict[str, Any], message_type: str) -> Dict[str, str]:
@@ -76,39 +143,26 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, str]:
         special_requests = passenger.get('special_requests', [])
         
         # Build prompt
-        prompt = f"""Generate a personalized, empathetic notification message for an airline passenger.
-
-Passenger Details:
-- Name: {first_name}
-- Tier: {tier}
-- Special Requests: {', '.join(special_requests) if special_requests else 'None'}
-
-Flight Event:
-- Type: {message_type}
-- Flight ID: {flight_event.get('flight_id')}
-- Details: {json.dumps(flight_event, indent=2)}
-
-Requirements:
-1. Address passenger by first name
-2. {"Acknowledge A-LIST status with priority language" if tier in ['A-LIST', 'A-LIST PREFERRED'] else "Use standard friendly tone"}
-3. {"Mention special assistance needs" if special_requests else ""}
-4. Adjust tone: {"informative" if message_type == 'DELAY_NOTIFICATION' else "apologetic" if message_type == 'CANCELLATION_NOTIFICATION' else "urgent"}
-5. Include actionable next steps
-6. Keep SMS under 160 characters
-
-Generate JSON response with:
-- email_subject: Brief subject line
-- email_body: 2-3 paragraph message
-- sms_body: Concise message under 160 chars
-"""
+        prompt = PROMPT_TEMPLATE.format(
+            first_name=first_name,
+            tier=tier,
+            special_requests=', '.join(special_requests) if special_requests else 'None',
+            message_type=message_type,
+            flight_id=flight_event.get('flight_id'),
+            flight_details=orjson.dumps(flight_event, option=orjson.OPT_INDENT_2).decode(),
+            tier_instruction="Acknowledge A-LIST status with priority language" if tier in ['A-LIST', 'A-LIST PREFERRED'] else "Use standard friendly tone",
+            special_instruction="\n3. Mention special assistance needs" if special_requests else "",
+            tone="informative" if message_type == 'DELAY_NOTIFICATION' else "apologetic" if message_type == 'CANCELLATION_NOTIFICATION' else "urgent",
+        )
 
         try:
             # Invoke Bedrock
             response = bedrock.invoke_model(
-                modelId=MODEL_ID,
-                body=json.dumps({
+                modelId=get_model_id(),
+                body=orjson.dumps({
                     'anthropic_version': 'bedrock-2023-05-31',
-                    'max_tokens': 1000,
+                    'max_tokens': MAX_TOKENS,
+                    'system': SYSTEM_PROMPT,
                     'messages': [{
                         'role': 'user',
                         'content': prompt
@@ -116,16 +170,19 @@ Generate JSON response with:
                 })
             )
             
-            response_body = json.loads(response['body'].read())
+            response_body = orjson.loads(response['body'].read())
             content = response_body.get('content', [{}])[0].get('text', '')
+            if response_body.get('stop_reason') == 'max_tokens':
+                # Truncated output usually fails JSON parsing; track it to tune MAX_TOKENS
+                logger.warning(f"LLM response hit max_tokens ({MAX_TOKENS})")
+                metrics.add_metric(name='LLMResponsesTruncated', unit=MetricUnit.Count, value=1)
             
             # Parse LLM response (try to extract JSON)
             try:
                 # Look for JSON in the response
-                import re
-                json_match = re.search(r'\{.*\}', content, re.DOTALL)
+                json_match = _JSON_RE.search(content)
                 if json_match:
-                    result = json.loads(json_match.group())
+                    result = orjson.loads(json_match.group())
                 else:
                     raise ValueError("No JSON found in response")
             except:
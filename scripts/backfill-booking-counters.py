@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Backfill FLIGHT#<id>/COUNTERS booking counts from existing booking items
+
+The stream handler keeps booking_count up to date for new and deleted
+bookings; run this once against tables that already hold bookings.
+"""
+import boto3
+from boto3.dynamodb.conditions import Attr, Key
+import os
+import sys
+
+from boto_config import boto_config
+
+TABLE_NAME = os.environ.get('TABLE_NAME', 'FlightPulseTable')
+REGION = os.environ.get('AWS_REGION', 'us-east-1')
+
+dynamodb = boto3.resource('dynamodb', region_name=REGION, config=boto_config)
+table = dynamodb.Table(TABLE_NAME)
+
+
+def list_flight_ids():
+    """List all flight IDs from flight METADATA items"""
+    scan_kwargs = {
+        'FilterExpression': Attr('PK').begins_with('FLIGHT#') & Attr('SK').eq('METADATA'),
+        'ProjectionExpression': 'PK',
+    }
+    while True:
+        response = table.scan(**scan_kwargs)
+        for item in response.get('Items', []):
+            yield item['PK'].split('#', 1)[1]
+        if 'LastEvaluatedKey' not in response:
+            break
+        scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+
+def count_bookings(flight_id):
+    """Count BOOKING# items under a flight"""
+    count = 0
+    query_kwargs = {
+        'KeyConditionExpression': Key('PK').eq(f'FLIGHT#{flight_id}') & Key('SK').begins_with('BOOKING#'),
+        'Select': 'COUNT',
+    }
+    while True:
+        response = table.query(**query_kwargs)
+        count += response.get('Count', 0)
+        if 'LastEvaluatedKey' not in response:
+            return count
+        query_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+
+def main():
+    """Main function"""
+    try:
+        table.load()
+    except Exception as e:
+        print(f"Error: Table {TABLE_NAME} does not exist: {e}")
+        print("Please deploy the CDK stack first: ./scripts/deploy.sh")
+        sys.exit(1)
+
+    print(f"Backfilling booking counters in table: {TABLE_NAME}")
+    print(f"Region: {REGION}")
+    print()
+
+    flights = 0
+    with table.batch_writer(overwrite_by_pkeys=['PK', 'SK']) as batch:
+        for flight_id in list_flight_ids():
+            booking_count = count_bookings(flight_id)
+            batch.put_item(Item={
+                'PK': f'FLIGHT#{flight_id}',
+                'SK': 'COUNTERS',
+                'booking_count': booking_count,
+            })
+            print(f"  ✓ {flight_id}: {booking_count} bookings")
+            flights += 1
+
+    print()
+    print(f"✓ Backfilled booking counters for {flights} flights")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,9 @@
+"""
+Shared botocore configuration for the FlightPulse scripts
+"""
+from botocore.config import Config
+
+# Adaptive retries back off client-side when DynamoDB throttles bulk writes
+boto_config = Config(
+    retries={'mode': 'adaptive', 'max_attempts': 3},
+)
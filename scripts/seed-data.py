@@ -6,74 +6,61 @@ import json
 import boto3
 import os
 import sys
+from decimal import Decimal
+
+from boto_config import boto_config
 
 TABLE_NAME = os.environ.get('TABLE_NAME', 'FlightPulseTable')
 REGION = os.environ.get('AWS_REGION', 'us-east-1')
 
-dynamodb = boto3.resource('dynamodb', region_name=REGION)
+dynamodb = boto3.resource('dynamodb', region_name=REGION, config=boto_config)
 table = dynamodb.Table(TABLE_NAME)
 
 
-def convert_to_dynamodb_item(item):
-    """Convert JSON item to DynamoDB format"""
-    dynamodb_item = {}
-    for key, value in item.items():
-        if isinstance(value, str):
-            dynamodb_item[key] = value
-        elif isinstance(value, bool):
-            dynamodb_item[key] = value
-        elif isinstance(value, int):
-            dynamodb_item[key] = value
-        elif isinstance(value, dict):
-            dynamodb_item[key] = value
-        elif isinstance(value, list):
-            dynamodb_item[key] = value
-        else:
-            dynamodb_item[key] = str(value)
-    return dynamodb_item
-
-
 def seed_flights():
     """Seed flight data"""
     print("Seeding flights...")
+    # Items are written as loaded; boto3 serializes native types and floats
+    # are parsed as Decimal, the only number type DynamoDB accepts
     with open('simulator/sample-data/flights.json', 'r') as f:
-        flights = json.load(f)
+        flights = json.load(f, parse_float=Decimal)
     
-    for flight in flights:
-        item = convert_to_dynamodb_item(flight)
-        table.put_item(Item=item)
-        print(f"  ✓ Seeded flight {flight['flight_id']}")
+    # batch_writer buffers puts into BatchWriteItem calls and resends unprocessed items
+    with table.batch_writer(overwrite_by_pkeys=['PK', 'SK']) as batch:
+        for flight in flights:
+            batch.put_item(Item=flight)
+    print(f"  ✓ Seeded {len(flights)} flights")
 
 
 def seed_passengers():
     """Seed passenger data"""
     print("Seeding passengers...")
     with open('simulator/sample-data/passengers.json', 'r') as f:
-        passengers = json.load(f)
+        passengers = json.load(f, parse_float=Decimal)
     
-    for passenger in passengers:
-        item = convert_to_dynamodb_item(passenger)
-        table.put_item(Item=item)
-        print(f"  ✓ Seeded passenger {passenger['passenger_id']}")
+    with table.batch_writer(overwrite_by_pkeys=['PK', 'SK']) as batch:
+        for passenger in passengers:
+            batch.put_item(Item=passenger)
+    print(f"  ✓ Seeded {len(passengers)} passengers")
 
 
 def seed_bookings():
     """Seed booking data"""
     print("Seeding bookings...")
     with open('simulator/sample-data/bookings.json', 'r') as f:
-        bookings = json.load(f)
+        bookings = json.load(f, parse_float=Decimal)
     
-    for booking in bookings:
-        item = convert_to_dynamodb_item(booking)
-        table.put_item(Item=item)
-        print(f"  ✓ Seeded booking {booking.get('booking_id', 'lookup')}")
+    with table.batch_writer(overwrite_by_pkeys=['PK', 'SK']) as batch:
+        for booking in bookings:
+            batch.put_item(Item=booking)
+    print(f"  ✓ Seeded {len(bookings)} bookings")
 
 
 def main():
     """Main function"""
     try:
         # Verify AWS credentials
-        sts = boto3.client('sts', region_name=REGION)
+        sts = boto3.client('sts', region_name=REGION, config=boto_config)
         sts.get_caller_identity()
     except Exception as e:
         print(f"Error: AWS CLI not configured properly: {e}")
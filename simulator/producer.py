@@ -1,33 +1,51 @@
-import json
+import orjson
 import uuid
 from datetime import datetime, timedelta
-from kafka import KafkaProducer
+from confluent_kafka import Producer
 import argparse
 
-producer = KafkaProducer(
-    bootstrap_servers=['localhost:9092'],
-    value_serializer=lambda v: json.dumps(v).encode('utf-8')
-)
+# Linger briefly so bursts of events are batched and compressed into fewer requests
+producer = Producer({
+    'bootstrap.servers': 'localhost:9092',
+    'linger.ms': 20,
+    'batch.size': 65536,
+    'compression.type': 'lz4',
+    'acks': 1,
+    'max.in.flight.requests.per.connection': 5,
+})
 
 TOPIC = 'flight-operations'
 
 
+def delivery_report(err, msg):
+    """Report events the broker did not accept."""
+    if err is not None:
+        print(f"Delivery failed for {msg.topic()} [{msg.partition()}]: {err}")
+
+
+def send_event(event: dict):
+    producer.produce(TOPIC, orjson.dumps(event), callback=delivery_report)
+    # Serve delivery callbacks without blocking the batch
+    producer.poll(0)
+
+
 def produce_delay_event(flight_id: str, delay_minutes: int, reason: str = 'WEATHER'):
+    now = datetime.utcnow()
     event = {
         'event_id': str(uuid.uuid4()),
         'event_type': 'FLIGHT_DELAY',
-        'timestamp': datetime.utcnow().isoformat(),
+        'timestamp': now.isoformat(),
         'source': 'operations_center',
         'payload': {
             'flight_id': flight_id,
             'delay_minutes': delay_minutes,
             'reason': reason,
             'reason_detail': f'{reason} conditions affecting operations',
-            'new_departure': (datetime.utcnow() + timedelta(minutes=delay_minutes)).isoformat(),
-            'new_arrival': (datetime.utcnow() + timedelta(minutes=delay_minutes + 120)).isoformat(),
+            'new_departure': (now + timedelta(minutes=delay_minutes)).isoformat(),
+            'new_arrival': (now + timedelta(minutes=delay_minutes + 120)).isoformat(),
         }
     }
-    producer.send(TOPIC, value=event)
+    send_event(event)
     print(f"Sent delay event for {flight_id}: {delay_minutes} min delay")
 
 
@@ -44,7 +62,7 @@ def produce_cancellation_event(flight_id: str, reason: str = 'WEATHER'):
             'rebooking_priority': 'HIGH',
         }
     }
-    producer.send(TOPIC, value=event)
+    send_event(event)
     print(f"Sent cancellation event for {flight_id}")
 
 
@@ -61,7 +79,7 @@ def produce_gate_change_event(flight_id: str, old_gate: str, new_gate: str, term
             'terminal_change': terminal_change,
         }
     }
-    producer.send(TOPIC, value=event)
+    send_event(event)
     print(f"Sent gate change event for {flight_id}: {old_gate} → {new_gate}")
 
 
@@ -1,149 +1,94 @@
 """
 Pre-built test scenarios for FlightPulse
 """
-import json
 import uuid
 from datetime import datetime, timedelta
-from kafka import KafkaProducer
+from typing import Optional
 
-producer = KafkaProducer(
-    bootstrap_servers=['localhost:9092'],
-    value_serializer=lambda v: json.dumps(v).encode('utf-8')
-)
+from producer import producer, send_event
 
-TOPIC = 'flight-operations'
+
+def _make_event(event_type: str, source: str, payload: dict, now: Optional[datetime] = None) -> dict:
+    """Wrap a payload in the standard flight-operations event envelope."""
+    return {
+        'event_id': str(uuid.uuid4()),
+        'event_type': event_type,
+        'timestamp': (now or datetime.utcnow()).isoformat(),
+        'source': source,
+        'payload': payload,
+    }
+
+
+def _delay_event(flight_id: str, delay_minutes: int, reason: str, reason_detail: str) -> dict:
+    now = datetime.utcnow()
+    return _make_event('FLIGHT_DELAY', 'operations_center', {
+        'flight_id': flight_id,
+        'delay_minutes': delay_minutes,
+        'reason': reason,
+        'reason_detail': reason_detail,
+        'new_departure': (now + timedelta(minutes=delay_minutes)).isoformat(),
+        'new_arrival': (now + timedelta(minutes=delay_minutes + 120)).isoformat(),
+    }, now)
+
+
+def _cancellation_event(flight_id: str, reason: str, reason_detail: str) -> dict:
+    return _make_event('FLIGHT_CANCELLED', 'operations_center', {
+        'flight_id': flight_id,
+        'reason': reason,
+        'reason_detail': reason_detail,
+        'rebooking_priority': 'HIGH',
+    })
+
+
+def _gate_change_event(flight_id: str, old_gate: str, new_gate: str, terminal_change: bool) -> dict:
+    return _make_event('GATE_CHANGE', 'airport_ops', {
+        'flight_id': flight_id,
+        'old_gate': old_gate,
+        'new_gate': new_gate,
+        'terminal_change': terminal_change,
+    })
 
 
 def scenario1_minor_delay():
     """Scenario 1: Minor Delay (< 30 min)"""
-    event = {
-        'event_id': str(uuid.uuid4()),
-        'event_type': 'FLIGHT_DELAY',
-        'timestamp': datetime.utcnow().isoformat(),
-        'source': 'operations_center',
-        'payload': {
-            'flight_id': 'SW1234',
-            'delay_minutes': 25,
-            'reason': 'WEATHER',
-            'reason_detail': 'Light weather conditions affecting operations',
-            'new_departure': (datetime.utcnow() + timedelta(minutes=25)).isoformat(),
-            'new_arrival': (datetime.utcnow() + timedelta(minutes=145)).isoformat(),
-        }
-    }
-    producer.send(TOPIC, value=event)
-    producer.flush()
+    send_event(_delay_event('SW1234', 25, 'WEATHER', 'Light weather conditions affecting operations'))
     print("Scenario 1: Minor delay event sent for SW1234")
 
 
 def scenario2_major_delay():
     """Scenario 2: Major Delay (30-120 min) with A-LIST passenger"""
-    event = {
-        'event_id': str(uuid.uuid4()),
-        'event_type': 'FLIGHT_DELAY',
-        'timestamp': datetime.utcnow().isoformat(),
-        'source': 'operations_center',
-        'payload': {
-            'flight_id': 'SW5678',
-            'delay_minutes': 90,
-            'reason': 'MECHANICAL',
-            'reason_detail': 'Aircraft maintenance required',
-            'new_departure': (datetime.utcnow() + timedelta(minutes=90)).isoformat(),
-            'new_arrival': (datetime.utcnow() + timedelta(minutes=210)).isoformat(),
-        }
-    }
-    producer.send(TOPIC, value=event)
-    producer.flush()
+    send_event(_delay_event('SW5678', 90, 'MECHANICAL', 'Aircraft maintenance required'))
     print("Scenario 2: Major delay event sent for SW5678")
 
 
 def scenario3_cancellation():
     """Scenario 3: Flight Cancellation"""
-    event = {
-        'event_id': str(uuid.uuid4()),
-        'event_type': 'FLIGHT_CANCELLED',
-        'timestamp': datetime.utcnow().isoformat(),
-        'source': 'operations_center',
-        'payload': {
-            'flight_id': 'SW9012',
-            'reason': 'WEATHER',
-            'reason_detail': 'Severe weather conditions require cancellation',
-            'rebooking_priority': 'HIGH',
-        }
-    }
-    producer.send(TOPIC, value=event)
-    producer.flush()
+    send_event(_cancellation_event('SW9012', 'WEATHER', 'Severe weather conditions require cancellation'))
     print("Scenario 3: Cancellation event sent for SW9012")
 
 
 def scenario4_gate_change():
     """Scenario 4: Gate Change with Terminal Change"""
-    event = {
-        'event_id': str(uuid.uuid4()),
-        'event_type': 'GATE_CHANGE',
-        'timestamp': datetime.utcnow().isoformat(),
-        'source': 'airport_ops',
-        'payload': {
-            'flight_id': 'SW3456',
-            'old_gate': 'A5',
-            'new_gate': 'D15',
-            'terminal_change': True,
-        }
-    }
-    producer.send(TOPIC, value=event)
-    producer.flush()
+    send_event(_gate_change_event('SW3456', 'A5', 'D15', True))
     print("Scenario 4: Gate change event sent for SW3456")
 
 
+# Scenario 5 events as (factory, args) so the whole burst is built before sending
+RAPID_SEQUENCE = [
+    (_delay_event, ('SW1234', 15, 'ATC', 'Air traffic control delay')),
+    (_gate_change_event, ('SW5678', 'B7', 'B12', False)),
+    (_delay_event, ('SW7890', 45, 'CREW', 'Crew scheduling delay')),
+]
+
+
 def scenario5_rapid_sequence():
     """Scenario 5: Rapid Sequence of Events"""
-    events = [
-        {
-            'event_id': str(uuid.uuid4()),
-            'event_type': 'FLIGHT_DELAY',
-            'timestamp': datetime.utcnow().isoformat(),
-            'source': 'operations_center',
-            'payload': {
-                'flight_id': 'SW1234',
-                'delay_minutes': 15,
-                'reason': 'ATC',
-                'reason_detail': 'Air traffic control delay',
-                'new_departure': (datetime.utcnow() + timedelta(minutes=15)).isoformat(),
-                'new_arrival': (datetime.utcnow() + timedelta(minutes=135)).isoformat(),
-            }
-        },
-        {
-            'event_id': str(uuid.uuid4()),
-            'event_type': 'GATE_CHANGE',
-            'timestamp': datetime.utcnow().isoformat(),
-            'source': 'airport_ops',
-            'payload': {
-                'flight_id': 'SW5678',
-                'old_gate': 'B7',
-                'new_gate': 'B12',
-                'terminal_change': False,
-            }
-        },
-        {
-            'event_id': str(uuid.uuid4()),
-            'event_type': 'FLIGHT_DELAY',
-            'timestamp': datetime.utcnow().isoformat(),
-            'source': 'operations_center',
-            'payload': {
-                'flight_id': 'SW7890',
-                'delay_minutes': 45,
-                'reason': 'CREW',
-                'reason_detail': 'Crew scheduling delay',
-                'new_departure': (datetime.utcnow() + timedelta(minutes=45)).isoformat(),
-                'new_arrival': (datetime.utcnow() + timedelta(minutes=165)).isoformat(),
-            }
-        },
-    ]
+    events = [factory(*args) for factory, args in RAPID_SEQUENCE]
     
     for event in events:
-        producer.send(TOPIC, value=event)
+        send_event(event)
     
-    producer.flush()
-    print("Scenario 5: Rapid sequence of 3 events sent")
+    print(f"Scenario 5: Rapid sequence of {len(events)} events sent")
 
 
 if __name__ == '__main__':
@@ -160,6 +105,7 @@ if __name__ == '__main__':
     
     if scenario in scenarios:
         scenarios[scenario]()
+        producer.flush()
     else:
         print(f"Unknown scenario: {scenario}")
         print("Available scenarios: 1, 2, 3, 4, 5")